@@ -0,0 +1,136 @@
+# analytics.py
+import csv
+import json
+from array import array
+from collections import Counter
+
+from storage import DATA_DIR
+from crud import list_actors, list_sets, list_props, list_characters
+
+# NumPy is optional - the pure-Python path gives the same results
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TONES = [1, 2, 3, 4, 5]
+REPORT_DIR = DATA_DIR / "analytics"
+
+def _index(items):
+    """Map entity id -> row/column position"""
+    return {item["id"]: i for i, item in enumerate(items)}
+
+def build_coverage():
+    """Count actor x set, set x tone and prop usage in one pass over the characters"""
+    actors = list_actors()
+    sets = list_sets()
+    props = list_props()
+    characters = list_characters()
+
+    actor_pos = _index(actors)
+    set_pos = _index(sets)
+    prop_pos = _index(props)
+    tone_pos = {tone: i for i, tone in enumerate(TONES)}
+    n_actors, n_sets, n_tones = len(actors), len(sets), len(TONES)
+
+    # Each character becomes one flat slot code: (actor, set, tone) packed into an int
+    slot_codes = array("q")
+    prop_codes = array("q")
+    unassigned = 0
+    for char in characters:
+        for prop_id in char.get("props", []):
+            if prop_id in prop_pos:
+                prop_codes.append(prop_pos[prop_id])
+        a = actor_pos.get(char.get("actor"))
+        s = set_pos.get(char.get("set_location"))
+        try:
+            t = tone_pos.get(int(char.get("tone_section")))
+        except (ValueError, TypeError):
+            t = None
+        if a is None or s is None or t is None:
+            unassigned += 1
+            continue
+        slot_codes.append((a * n_sets + s) * n_tones + t)
+
+    if np is not None:
+        slot_counts = np.bincount(np.frombuffer(slot_codes, dtype=np.int64),
+                                  minlength=n_actors * n_sets * n_tones)
+        cube = slot_counts.reshape(n_actors, n_sets, n_tones)
+        actor_set = cube.sum(axis=2).tolist()
+        set_tone = cube.sum(axis=0).tolist()
+        prop_usage = np.bincount(np.frombuffer(prop_codes, dtype=np.int64),
+                                 minlength=len(props)).tolist()
+        filled = {int(code): int(slot_counts[code]) for code in np.flatnonzero(slot_counts)}
+    else:
+        filled = Counter(slot_codes)
+        actor_set = [[0] * n_sets for _ in range(n_actors)]
+        set_tone = [[0] * n_tones for _ in range(n_sets)]
+        for code, count in filled.items():
+            rest, t = divmod(code, n_tones)
+            a, s = divmod(rest, n_sets)
+            actor_set[a][s] += count
+            set_tone[s][t] += count
+        prop_usage = [0] * len(props)
+        for p in prop_codes:
+            prop_usage[p] += 1
+
+    slots = []
+    for code in sorted(filled):
+        rest, t = divmod(code, n_tones)
+        a, s = divmod(rest, n_sets)
+        slots.append({
+            "actor": actors[a]["id"],
+            "set_location": sets[s]["id"],
+            "tone_section": TONES[t],
+            "count": filled[code]
+        })
+
+    return {
+        "actors": [{"id": a["id"], "name": a["name"]} for a in actors],
+        "sets": [{"id": s["id"], "name": s["name"]} for s in sets],
+        "tones": TONES,
+        "props": [{"id": p["id"], "name": p["name"]} for p in props],
+        "actor_set": actor_set,
+        "set_tone": set_tone,
+        "prop_usage": prop_usage,
+        "slots": slots,
+        "unassigned": unassigned
+    }
+
+def overloaded_slots(coverage, limit=1):
+    """Actor/set/tone slots holding more than `limit` characters"""
+    return [slot for slot in coverage["slots"] if slot["count"] > limit]
+
+# ===== EXPORT =====
+def export_json(coverage, path=None):
+    path = path or REPORT_DIR / "coverage.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(coverage, f, ensure_ascii=False, indent=2)
+    return path
+
+def _write_matrix(path, row_items, col_labels, matrix):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name"] + col_labels)
+        for item, row in zip(row_items, matrix):
+            writer.writerow([item["id"], item["name"]] + list(row))
+
+def export_csv(coverage, directory=None):
+    """Write one CSV per count matrix, returns the written paths"""
+    directory = directory or REPORT_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    set_labels = [s["name"] for s in coverage["sets"]]
+    tone_labels = [f"tone {tone}" for tone in coverage["tones"]]
+
+    paths = [directory / "actor_set.csv", directory / "set_tone.csv",
+             directory / "prop_usage.csv", directory / "slots.csv"]
+    _write_matrix(paths[0], coverage["actors"], set_labels, coverage["actor_set"])
+    _write_matrix(paths[1], coverage["sets"], tone_labels, coverage["set_tone"])
+    _write_matrix(paths[2], coverage["props"], ["used_by"],
+                  [[count] for count in coverage["prop_usage"]])
+    with open(paths[3], "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["actor", "set_location", "tone_section", "count"])
+        writer.writeheader()
+        writer.writerows(coverage["slots"])
+    return paths
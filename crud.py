@@ -1,6 +1,9 @@
 # crud.py
 import uuid
 from storage import load_json, save_json, get_next_id
+from indexes import get_page
+from models import Character
+from dataclasses import fields
 
 # File constants
 ACTOR_FILE = "actors.json"
@@ -8,6 +11,12 @@ SET_FILE = "sets.json"
 PROP_FILE = "props.json"
 CHARACTER_FILE = "characters.json"
 
+# Sort fields accepted by the list_*_page functions, default first
+ACTOR_SORTS = ["id", "name", "PinyinInitial"]
+SET_SORTS = ["id", "name"]
+PROP_SORTS = ["id", "name", "category"]
+CHARACTER_SORTS = ["id", "hanzi", "pinyin", "actor", "set_tone"]
+
 # ===== ACTOR CRUD =====
 def create_actor(name, PinyinInitial=""):
     actors = load_json(ACTOR_FILE)
@@ -30,6 +39,10 @@ def create_actor(name, PinyinInitial=""):
 def list_actors():
     return load_json(ACTOR_FILE)
 
+def list_actors_page(sort_by="id", limit=20, after=None):
+    """Page of actors sorted by one of ACTOR_SORTS - returns (items, next_cursor)"""
+    return get_page(ACTOR_FILE, sort_by, limit, after, ACTOR_SORTS)
+
 def list_missing_actors():
     actors = load_json(ACTOR_FILE)
     return [actor for actor in actors if actor.get("name")==""]
@@ -85,6 +98,10 @@ def create_set(name, tone_sections):
 def list_sets():
     return load_json(SET_FILE)
 
+def list_sets_page(sort_by="id", limit=20, after=None):
+    """Page of sets sorted by one of SET_SORTS - returns (items, next_cursor)"""
+    return get_page(SET_FILE, sort_by, limit, after, SET_SORTS)
+
 def get_set(set_id):
     sets = load_json(SET_FILE)
     for set_loc in sets:
@@ -132,6 +149,10 @@ def create_prop(name, category="general", components=None):
 def list_props():
     return load_json(PROP_FILE)
 
+def list_props_page(sort_by="id", limit=20, after=None):
+    """Page of props sorted by one of PROP_SORTS - returns (items, next_cursor)"""
+    return get_page(PROP_FILE, sort_by, limit, after, PROP_SORTS)
+
 def get_prop(prop_id):
     props = load_json(PROP_FILE)
     for prop in props:
@@ -186,6 +207,7 @@ def create_character(hanzi, pinyin, meaning, actor_id, set_id, tone_section, pro
         "set_location": set_id,
         "tone_section": tone_section,
         "props": props or [],
+        "plot": "",
         "memory_scene": memory_scene,
         "audio_file": audio_file
     }
@@ -219,6 +241,10 @@ def create_character(hanzi, pinyin, meaning, actor_id, set_id, tone_section, pro
 def list_characters():
     return load_json(CHARACTER_FILE)
 
+def list_characters_page(sort_by="id", limit=20, after=None):
+    """Page of characters sorted by one of CHARACTER_SORTS - returns (items, next_cursor)"""
+    return get_page(CHARACTER_FILE, sort_by, limit, after, CHARACTER_SORTS)
+
 def get_character(char_id):
     characters = load_json(CHARACTER_FILE)
     for char in characters:
@@ -303,6 +329,30 @@ def update_character(char_id, **updates):
     
     return updated_char
 
+def update_characters(updates):
+    """Apply {char_id: {field: value}} to many characters with one load and one save.
+
+    Only for plain fields - actor, set_location and props keep their
+    relationship bookkeeping in update_character. Fields from the Character
+    model that are missing on older records are added. Returns the ids updated.
+    """
+    linked = {"id", "actor", "set_location", "props"}
+    allowed = {f.name for f in fields(Character)} - linked
+    for char_updates in updates.values():
+        bad = set(char_updates) - allowed
+        if bad:
+            raise ValueError(f"Can't bulk update fields: {', '.join(sorted(bad))}")
+
+    characters = load_json(CHARACTER_FILE)
+    updated = []
+    for char in characters:
+        if char["id"] in updates:
+            char.update(updates[char["id"]])
+            updated.append(char["id"])
+    if updated:
+        save_json(CHARACTER_FILE, characters)
+    return updated
+
 def delete_character(char_id):
     characters = load_json(CHARACTER_FILE)
     character_to_delete = None
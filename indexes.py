@@ -0,0 +1,112 @@
+# indexes.py
+import copy
+import json
+from bisect import bisect_right
+
+from storage import DATA_DIR, load_json
+
+# Sorted secondary indexes, rebuilt only when the backing JSON file changes.
+# (file, sort_by) -> (file stamp, sorted entries); file -> (file stamp, items by id)
+_INDEXES = {}
+_ITEMS = {}
+
+def _id_key(item_id):
+    """Numeric ids sort numerically, anything else after them as text"""
+    try:
+        return (int(item_id), str(item_id))
+    except (ValueError, TypeError):
+        return (float("inf"), str(item_id))
+
+def _text(value):
+    return (str(value or "").lower(),)
+
+def _tone(value):
+    """Numeric tones first, anything else (e.g. from the JS app) after them as text"""
+    try:
+        return (int(value), "")
+    except (ValueError, TypeError):
+        return (float("inf"), str(value or ""))
+
+# Sort key builders per sort field - each returns a flat tuple of primitives
+SORT_KEYS = {
+    "id": lambda item: (),
+    "name": lambda item: _text(item.get("name")),
+    "PinyinInitial": lambda item: _text(item.get("PinyinInitial")),
+    "category": lambda item: _text(item.get("category")),
+    "hanzi": lambda item: (str(item.get("hanzi") or ""),),
+    "pinyin": lambda item: _text(item.get("pinyin")),
+    "actor": lambda item: _id_key(item.get("actor")),
+    "set_tone": lambda item: _id_key(item.get("set_location")) + _tone(item.get("tone_section")),
+}
+
+def _stamp(name):
+    path = DATA_DIR / name
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _items(name, stamp):
+    cached = _ITEMS.get(name)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    items = {item["id"]: item for item in load_json(name)}
+    _ITEMS[name] = (stamp, items)
+    return items
+
+def get_index(name, sort_by="id", stamp=None):
+    """Sorted (sort key..., id key..., id) entries for a data file"""
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Can't sort by '{sort_by}'")
+    stamp = stamp or _stamp(name)
+    cached = _INDEXES.get((name, sort_by))
+    if cached and cached[0] == stamp:
+        return cached[1]
+    make_key = SORT_KEYS[sort_by]
+    entries = sorted(make_key(item) + _id_key(item["id"]) for item in _items(name, stamp).values())
+    _INDEXES[(name, sort_by)] = (stamp, entries)
+    return entries
+
+def _decode_cursor(after, sort_by, entries):
+    """Cursor -> index entry, checking it was made for this sort field"""
+    try:
+        decoded = json.loads(after)
+    except ValueError:
+        decoded = None
+    if not isinstance(decoded, list) or len(decoded) < 2:
+        raise ValueError(f"Invalid page cursor '{after}'")
+    if decoded[0] != sort_by:
+        raise ValueError(f"Cursor '{after}' doesn't match sort field '{sort_by}'")
+    entry = tuple(decoded[1:])
+    if entries and len(entry) != len(entries[0]):
+        raise ValueError(f"Cursor '{after}' doesn't match sort field '{sort_by}'")
+    return entry
+
+def get_page(name, sort_by="id", limit=20, after=None, sort_fields=None):
+    """Return (items, next_cursor) for the page following the `after` cursor.
+
+    Cursors are the sort field plus the JSON-encoded index entry of the last
+    item on a page, so they stay valid when other items are added or removed.
+    """
+    if sort_fields is not None and sort_by not in sort_fields:
+        raise ValueError(f"Can't sort by '{sort_by}', expected one of: {', '.join(sort_fields)}")
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"Page limit must be at least 1, got {limit!r}")
+
+    # Read the stamp once so the index and the items map describe the same file
+    stamp = _stamp(name)
+    entries = get_index(name, sort_by, stamp)
+    items = _items(name, stamp)
+    start = 0
+    if after:
+        cursor = _decode_cursor(after, sort_by, entries)
+        try:
+            start = bisect_right(entries, cursor)
+        except TypeError:
+            raise ValueError(f"Cursor '{after}' doesn't match sort field '{sort_by}'")
+    page = entries[start:start + limit]
+    next_cursor = None
+    if start + limit < len(entries):
+        next_cursor = json.dumps([sort_by, *page[-1]], ensure_ascii=False)
+    # Copies, so callers can't change the cached items - same contract as load_json
+    return [copy.deepcopy(items[entry[-1]]) for entry in page], next_cursor
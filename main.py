@@ -1,9 +1,32 @@
 # main.py
 from crud import *
+from analytics import build_coverage, overloaded_slots, export_csv, export_json
+from scenes import generate_scenes
+
+PAGE_SIZE = 20
 
 def print_separator():
     print("\n" + "="*50 + "\n")
 
+def page_through(fetch_page, show_item, sort_options):
+    """Print results one page at a time using keyset cursors"""
+    sort_by = input(f"Sort by ({'/'.join(sort_options)}, enter for {sort_options[0]}): ").strip() or sort_options[0]
+    if sort_by not in sort_options:
+        print("❌ Invalid sort field")
+        return
+    cursor = None
+    page_number = 1
+    while True:
+        items, cursor = fetch_page(sort_by=sort_by, limit=PAGE_SIZE, after=cursor)
+        print(f"\n📄 Page {page_number}:")
+        for item in items:
+            show_item(item)
+        if cursor is None:
+            break
+        if input("\nEnter for next page, q to stop: ").strip().lower() == "q":
+            break
+        page_number += 1
+
 def main():
     print("🎭 HMM Dashboard - Week 1 CLI Test")
     print("Manage your memory palace system\n")
@@ -40,7 +63,7 @@ def manage_actors():
     while True:
         print_separator()
         print("ACTORS MANAGEMENT:")
-        print("1. List all actors")
+        print("1. List actors")
         print("2. Add new actor")
         print("3. Update actor")
         print("4. Delete actor")
@@ -51,11 +74,10 @@ def manage_actors():
         choice = input("\nChoose action: ").strip()
         
         if choice == "1":
-            actors = list_actors()
-            print(f"\n📋 Found {len(actors)} actors:")
-            for actor in actors:
+            def show_actor(actor):
                 print(f"  {actor['id']}: {actor['name']} - {actor['PinyinInitial']}")
                 print(f"     Characters: {len(actor['characters'])}")
+            page_through(list_actors_page, show_actor, ACTOR_SORTS)
                 
         elif choice == "2":
             name = input("Actor name: ").strip()
@@ -103,20 +125,19 @@ def manage_sets():
     while True:
         print_separator()
         print("SET LOCATIONS MANAGEMENT:")
-        print("1. List all sets")
+        print("1. List sets")
         print("2. Add new set")
         print("0. Back to main menu")
         
         choice = input("\nChoose action: ").strip()
         
         if choice == "1":
-            sets = list_sets()
-            print(f"\n🏢 Found {len(sets)} sets:")
-            for set_loc in sets:
+            def show_set(set_loc):
                 print(f"  {set_loc['id']}: {set_loc['name']}")
                 for tone, section in set_loc['tone_sections'].items():
                     print(f"    Tone {tone}: {section}")
                 print(f"    Characters: {len(set_loc['characters'])}")
+            page_through(list_sets_page, show_set, SET_SORTS)
                 
         elif choice == "2":
             name = input("Set name: ").strip()
@@ -139,20 +160,19 @@ def manage_props():
     while True:
         print_separator()
         print("PROPS MANAGEMENT:")
-        print("1. List all props")
+        print("1. List props")
         print("2. Add new prop")
         print("0. Back to main menu")
         
         choice = input("\nChoose action: ").strip()
         
         if choice == "1":
-            props = list_props()
-            print(f"\n🎭 Found {len(props)} props:")
-            for prop in props:
+            def show_prop(prop):
                 print(f"  {prop['id']}: {prop['name']} ({prop['category']})")
                 if prop['components']:
                     print(f"     Components: {', '.join(prop['components'])}")
                 print(f"     Used by: {len(prop['used_by'])} characters")
+            page_through(list_props_page, show_prop, PROP_SORTS)
                 
         elif choice == "2":
             name = input("Prop name: ").strip()
@@ -169,23 +189,26 @@ def manage_characters():
     while True:
         print_separator()
         print("CHARACTERS MANAGEMENT:")
-        print("1. List all characters")
+        print("1. List characters")
         print("2. Add new character")
+        print("3. Generate memory scenes")
         print("0. Back to main menu")
         
         choice = input("\nChoose action: ").strip()
         
         if choice == "1":
-            characters = list_characters()
-            print(f"\n🈴 Found {len(characters)} characters:")
-            for char in characters:
-                actor = get_actor(char['actor'])
-                set_loc = get_set(char['set_location'])
+            # Look up names from maps loaded once, not a file read per row
+            actors = {actor['id']: actor for actor in list_actors()}
+            sets = {set_loc['id']: set_loc for set_loc in list_sets()}
+            def show_character(char):
+                actor = actors.get(char['actor'])
+                set_loc = sets.get(char['set_location'])
                 actor_name = actor['name'] if actor else "Unknown"
                 set_name = set_loc['name'] if set_loc else "Unknown"
                 print(f"  {char['id']}: {char['hanzi']} ({char['pinyin']}) - {char['meaning']}")
                 print(f"     Actor: {actor_name}, Set: {set_name}, Tone: {char['tone_section']}")
                 print(f"     Props: {len(char['props'])}")
+            page_through(list_characters_page, show_character, CHARACTER_SORTS)
                 
         elif choice == "2":
             try:
@@ -230,6 +253,11 @@ def manage_characters():
             except Exception as e:
                 print(f"❌ Unexpected error: {e}")
                 
+        elif choice == "3":
+            overwrite = input("Overwrite hand-written scenes? (y/n): ").strip().lower() == "y"
+            updated = generate_scenes(overwrite=overwrite)
+            print(f"✅ Generated scenes for {len(updated)} characters")
+                
         elif choice == "0":
             break
 
@@ -240,6 +268,7 @@ def search_tools():
         print("1. Search actors by name")
         print("2. Search props by component")
         print("3. Find characters in tone section")
+        print("4. Coverage report")
         print("0. Back to main menu")
         
         choice = input("\nChoose action: ").strip()
@@ -266,6 +295,19 @@ def search_tools():
             for char in results:
                 print(f"  {char['hanzi']} ({char['pinyin']}) - {char['meaning']}")
                 
+        elif choice == "4":
+            coverage = build_coverage()
+            filled = len(coverage["slots"])
+            overloaded = overloaded_slots(coverage)
+            print(f"\n📊 {filled} actor/set/tone slots filled, {len(overloaded)} overloaded")
+            print(f"   Characters missing actor/set/tone: {coverage['unassigned']}")
+            for slot in overloaded:
+                print(f"  Actor {slot['actor']}, Set {slot['set_location']}, Tone {slot['tone_section']}: {slot['count']} characters")
+            if input("Export to CSV/JSON? (y/n): ").strip().lower() == "y":
+                paths = export_csv(coverage) + [export_json(coverage)]
+                for path in paths:
+                    print(f"✅ Wrote {path}")
+                
         elif choice == "0":
             break
 
@@ -0,0 +1,167 @@
+# scenes.py
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+from storage import load_json, save_json
+from crud import list_actors, list_sets, list_props, list_characters, update_characters
+
+SCENE_CACHE_FILE = "scene_cache.json"
+
+# ===== GENERATORS =====
+class SceneGenerator(ABC):
+    """Base class - turn a character's context into a memory scene and plot"""
+
+    @abstractmethod
+    def generate(self, context):
+        ...
+
+    def cache_id(self):
+        """Identifies this generator's output in the scene cache"""
+        return type(self).__name__
+
+class TemplateGenerator(SceneGenerator):
+    """Fills plain string templates locally, no external services"""
+
+    def __init__(self, scene_template=None, plot_template=None):
+        self.scene_template = scene_template or "{actor} {props_phrase}in the {room} of {set} and {meaning_lower}"
+        self.plot_template = plot_template or "{hanzi} ({pinyin}) - {meaning}: {actor} / {set} / {room}"
+
+    def generate(self, context):
+        values = dict(context)
+        props = context["props"]
+        values["props_phrase"] = f"with {', '.join(props)} " if props else ""
+        values["meaning_lower"] = context["meaning"].lower()
+        return {
+            "memory_scene": self.scene_template.format(**values),
+            "plot": self.plot_template.format(**values)
+        }
+
+    def cache_id(self):
+        return json.dumps([type(self).__name__, self.scene_template, self.plot_template], ensure_ascii=False)
+
+class StubGenerator(SceneGenerator):
+    """Returns empty scenes - placeholder for testing the pipeline or a future model backend"""
+
+    def generate(self, context):
+        return {"memory_scene": "", "plot": ""}
+
+# ===== CACHE =====
+def scene_key(generator, context):
+    """Hash of the generator and the resolved names a scene is built from"""
+    inputs = [generator.cache_id(), context]
+    return hashlib.sha1(json.dumps(inputs, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+def load_scene_cache():
+    cache = load_json(SCENE_CACHE_FILE)
+    if not cache:  # load_json returns [] for a missing file
+        cache = {}
+    cache.setdefault("results", {})
+    cache.setdefault("characters", {})
+    return cache
+
+# ===== PIPELINE =====
+def _build_context(char, actors, sets, props):
+    actor = actors.get(char["actor"])
+    set_loc = sets.get(char["set_location"])
+    tone_sections = set_loc["tone_sections"] if set_loc else {}
+    return {
+        "hanzi": char["hanzi"],
+        "pinyin": char["pinyin"],
+        "meaning": char["meaning"],
+        "tone_section": char["tone_section"],
+        "actor": actor["name"] if actor else "Someone",
+        "set": set_loc["name"] if set_loc else "somewhere",
+        "room": tone_sections.get(str(char["tone_section"]), f"tone {char['tone_section']} room"),
+        "props": sorted(props[p]["name"] for p in char.get("props", []) if p in props)
+    }
+
+def _is_hand_written(char, results, seen):
+    """A non-empty scene that isn't the one this pipeline last wrote for the character"""
+    scene = char.get("memory_scene")
+    if not scene:
+        return False
+    last = results.get(seen.get(char["id"]))
+    return last is None or last.get("memory_scene") != scene
+
+def _generate(generator, queue, results, workers, use_processes):
+    """Run the queue on a pool, storing each result as soon as it arrives"""
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    error = None
+    with executor_class(max_workers=workers) as executor:
+        futures = {executor.submit(generator.generate, context): key for key, context in queue.items()}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                error = error or e
+    if error:
+        raise error
+
+def _flush(batch, results, seen):
+    """One bulk write per batch; only characters actually written are marked done"""
+    written = update_characters({char_id: results[key] for char_id, key in batch})
+    keys = dict(batch)
+    for char_id in written:
+        seen[char_id] = keys[char_id]
+    batch.clear()
+    return written
+
+def generate_scenes(generator=None, workers=4, batch_size=5000, use_processes=False, overwrite=False):
+    """Generate memory scenes for characters whose inputs changed since the last run.
+
+    Hand-written scenes (anything other than the last generated one) are left
+    alone unless overwrite is True, which also regenerates everything else.
+    Each batch rewrites characters.json once, so keep batch_size large.
+    Returns the ids of the updated characters.
+    """
+    generator = generator or TemplateGenerator()
+    cache = load_scene_cache()
+    results, seen = cache["results"], cache["characters"]
+
+    actors = {a["id"]: a for a in list_actors()}
+    sets = {s["id"]: s for s in list_sets()}
+    props = {p["id"]: p for p in list_props()}
+
+    # Work queue: one entry per distinct input key still missing a result
+    characters = list_characters()
+    # Forget deleted characters so a reused id doesn't inherit their state
+    live_ids = {char["id"] for char in characters}
+    for char_id in [char_id for char_id in seen if char_id not in live_ids]:
+        del seen[char_id]
+
+    pending = []
+    queue = {}
+    for char in characters:
+        context = _build_context(char, actors, sets, props)
+        key = scene_key(generator, context)
+        if not overwrite:
+            if seen.get(char["id"]) == key:
+                continue
+            if _is_hand_written(char, results, seen):
+                continue
+        pending.append((char["id"], key))
+        if (overwrite or key not in results) and key not in queue:
+            queue[key] = context
+
+    if queue:
+        try:
+            _generate(generator, queue, results, workers, use_processes)
+        finally:
+            # Keep finished results even if a generate() call failed
+            save_json(SCENE_CACHE_FILE, cache)
+
+    # Write back in batches, saving the cache after each batch so an interrupted run can resume
+    updated = []
+    batch = []
+    for char_id, key in pending:
+        batch.append((char_id, key))
+        if len(batch) >= batch_size:
+            updated += _flush(batch, results, seen)
+            save_json(SCENE_CACHE_FILE, cache)
+    if batch:
+        updated += _flush(batch, results, seen)
+    save_json(SCENE_CACHE_FILE, cache)
+
+    return updated